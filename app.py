@@ -33,6 +33,15 @@ app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
 }
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
 
+# Bulk room provisioning over HTTP is limited to these usernames (comma-separated);
+# when empty, /api/rooms/bulk is disabled and only the CLI can provision rooms
+app.config["BULK_PROVISIONING_USERS"] = {
+    username.strip() for username in os.environ.get("BULK_PROVISIONING_USERS", "").split(",") if username.strip()
+}
+# Each room costs one scrypt hash (~0.1s of CPU), so large cohorts belong in `flask provision-rooms`
+app.config["BULK_MAX_ROOMS"] = int(os.environ.get("BULK_MAX_ROOMS", 50))
+app.config["BULK_MAX_MEMBERS"] = int(os.environ.get("BULK_MAX_MEMBERS", 100))
+
 # Initialize extensions
 db.init_app(app)
 login_manager.init_app(app)
@@ -53,6 +62,8 @@ with app.app_context():
     from models import User, Room, Topic, Subtopic, UserProgress, StudySession, Note
     import routes
     import socket_events
+    import assets
+    import provisioning
     
     # Create all tables
     db.create_all()
\ No newline at end of file
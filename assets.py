@@ -0,0 +1,204 @@
+import os
+import gzip
+import hmac
+import json
+import base64
+import hashlib
+import tempfile
+import mimetypes
+import urllib.error
+import urllib.request
+import click
+from flask import request, send_from_directory, url_for
+from markupsafe import Markup
+from app import app
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip variants are always built
+    brotli = None
+
+STATIC_DIR = app.static_folder
+DIST_DIR = os.path.join(STATIC_DIR, 'dist')
+MANIFEST_PATH = os.path.join(DIST_DIR, 'manifest.json')
+ONE_YEAR = 365 * 24 * 60 * 60
+
+# Client libraries vendored under static/vendor so pages never depend on a CDN.
+# If a file is missing, asset_url() falls back to the CDN and asset_attrs() adds
+# the pinned SRI hash; `flask vendor-assets` re-fetches them and checks that hash.
+VENDOR_ASSETS = {
+    'vendor/bootstrap/bootstrap.min.css': (
+        'https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/css/bootstrap.min.css',
+        'sha384-QWTKZyjpPEjISv5WaRU9OFeRpok6YctnYmDr5pNlyT2bRjXh0JMhjY6hW+ALEwIH',
+    ),
+    'vendor/bootstrap/bootstrap.bundle.min.js': (
+        'https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/js/bootstrap.bundle.min.js',
+        'sha384-YvpcrYf0tY3lHB60NNkmXc5s9fDVZLESaAA55NDzOxhy9GkcIdslK1eN7N6jIeHz',
+    ),
+    'vendor/socket.io/socket.io.min.js': (
+        'https://cdn.socket.io/4.7.2/socket.io.min.js',
+        'sha384-mZLF4UVrpi/QTWPA7BjNPEnkIfRFn4ZEO3Qt/HFklTJBj/gBOV8G3HcKn4NfQblz',
+    ),
+}
+
+# Files (relative to static/) that get a content-hash filename and precompressed variants
+BUNDLES = ['css/custom.css', 'js/room.js'] + list(VENDOR_ASSETS)
+
+# Maps logical asset paths to their fingerprinted name under static/dist
+manifest = {}
+
+
+def fingerprint(path, content):
+    digest = hashlib.sha256(content).hexdigest()[:12]
+    base, ext = os.path.splitext(path)
+    return f"{base}.{digest}{ext}"
+
+
+def write_atomic(path, content):
+    # Write to a temp file and rename it into place so concurrent workers never
+    # see a partial file that would then be cached as immutable
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        os.chmod(tmp_path, 0o644)  # mkstemp creates files readable by the owner only
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def write_compressed(path, content):
+    # mtime=0 keeps the gzip output byte-identical across builds
+    write_atomic(path + '.gz', gzip.compress(content, compresslevel=9, mtime=0))
+    if brotli is not None:
+        write_atomic(path + '.br', brotli.compress(content, quality=11))
+    # The uncompressed file goes last: once it exists its variants are complete
+    write_atomic(path, content)
+
+
+def is_built(path, content):
+    if not os.path.isfile(path):
+        return False
+    with open(path, 'rb') as f:
+        return f.read() == content
+
+
+def build_assets():
+    """Write fingerprinted, precompressed copies of BUNDLES to static/dist."""
+    built = {}
+    for path in BUNDLES:
+        source = os.path.join(STATIC_DIR, path)
+        if not os.path.isfile(source):
+            continue
+        with open(source, 'rb') as f:
+            content = f.read()
+
+        hashed = fingerprint(path, content)
+        target = os.path.join(DIST_DIR, hashed)
+        if not is_built(target, content):
+            write_compressed(target, content)
+        built[path] = hashed
+
+    write_atomic(MANIFEST_PATH, json.dumps(built, indent=2, sort_keys=True).encode())
+    return built
+
+
+def manifest_is_stale():
+    if not os.path.isfile(MANIFEST_PATH):
+        return True
+    built_at = os.path.getmtime(MANIFEST_PATH)
+    for path in BUNDLES:
+        source = os.path.join(STATIC_DIR, path)
+        if os.path.isfile(source) and os.path.getmtime(source) > built_at:
+            return True
+    return False
+
+
+def load_manifest():
+    manifest.clear()
+    try:
+        if manifest_is_stale():
+            manifest.update(build_assets())
+        else:
+            with open(MANIFEST_PATH) as f:
+                manifest.update(json.load(f))
+    except (OSError, ValueError) as e:
+        # Read-only deployments without a prebuilt manifest fall back to plain /static URLs
+        app.logger.warning(f"Could not build static assets: {e}")
+
+
+def uses_cdn(path):
+    return (path not in manifest and path in VENDOR_ASSETS
+            and not os.path.isfile(os.path.join(STATIC_DIR, path)))
+
+
+@app.template_global()
+def asset_url(path):
+    if path in manifest:
+        return url_for('asset', filename=manifest[path])
+    if uses_cdn(path):
+        return VENDOR_ASSETS[path][0]
+    return url_for('static', filename=path)
+
+
+@app.template_global()
+def asset_attrs(path):
+    # Subresource integrity for the CDN fallback; local assets need none
+    if uses_cdn(path):
+        return Markup(f' integrity="{VENDOR_ASSETS[path][1]}" crossorigin="anonymous"')
+    return ''
+
+
+@app.route('/assets/<path:filename>')
+def asset(filename):
+    mimetype = mimetypes.guess_type(filename)[0]
+    encoding = None
+    for candidate, suffix in (('br', '.br'), ('gzip', '.gz')):
+        if request.accept_encodings[candidate] and os.path.isfile(os.path.join(DIST_DIR, filename + suffix)):
+            encoding = candidate
+            filename += suffix
+            break
+
+    response = send_from_directory(DIST_DIR, filename, mimetype=mimetype, max_age=ONE_YEAR)
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
+
+
+@app.cli.command('build-assets')
+def build_assets_command():
+    """Fingerprint and precompress static bundles into static/dist."""
+    built = build_assets()
+    for path, hashed in sorted(built.items()):
+        click.echo(f"{path} -> dist/{hashed}")
+
+
+def integrity_matches(content, integrity):
+    algorithm, expected = integrity.split('-', 1)
+    digest = base64.b64encode(hashlib.new(algorithm, content).digest()).decode()
+    return hmac.compare_digest(digest, expected)
+
+
+@app.cli.command('vendor-assets')
+def vendor_assets_command():
+    """Download pinned client libraries into static/vendor."""
+    for path, (source_url, integrity) in VENDOR_ASSETS.items():
+        try:
+            with urllib.request.urlopen(source_url) as response:
+                content = response.read()
+        except urllib.error.URLError as e:
+            raise click.ClickException(f"Could not download {source_url}: {e.reason}")
+        if not integrity_matches(content, integrity):
+            raise click.ClickException(f"Integrity check failed for {source_url}")
+        write_atomic(os.path.join(STATIC_DIR, path), content)
+        click.echo(f"{source_url} -> static/{path}")
+    load_manifest()
+    click.echo(f"Rebuilt {len(manifest)} bundles")
+
+
+load_manifest()
@@ -0,0 +1,107 @@
+"""Benchmark bulk room provisioning against the one-post-per-room path.
+
+Creates a throwaway SQLite database, a cohort of users, and provisions
+ROOMS rooms with MEMBERS members and a small syllabus each. The per-room
+baseline (create_room + one join_room per student) is timed on a sample
+and extrapolated, since running it for the full cohort takes minutes.
+
+    python bench_provisioning.py [--rooms 500] [--members 50] [--sample 10]
+"""
+import os
+import time
+import random
+import argparse
+import tempfile
+
+# Point the app at a scratch database before it is imported
+db_path = os.path.join(tempfile.mkdtemp(), 'bench.db')
+os.environ['DATABASE_URL'] = f"sqlite:///{db_path}"
+
+from sqlalchemy import insert
+from werkzeug.security import generate_password_hash, check_password_hash
+from app import app, db
+from models import User, Room, Topic, Subtopic
+from provisioning import provision_rooms
+
+COHORT_SIZE = 2000
+
+
+def make_rooms(count, members, usernames):
+    return [{
+        'name': f"Cohort room {index}",
+        'password': f"pass-{index}",
+        'members': random.sample(usernames, members),
+        'syllabus': [{
+            'name': f"Topic {topic_index}",
+            'subtopics': [{'name': f"Subtopic {subtopic_index}", 'time': 30}
+                          for subtopic_index in range(4)]
+        } for topic_index in range(5)]
+    } for index in range(count)]
+
+
+def create_room_per_post(spec, creator, users_by_name):
+    # Mirrors routes.create_room, update_syllabus and one join_room per student
+    room = Room()
+    room.room_id = Room.generate_room_id()
+    room.name = spec['name']
+    room.password_hash = generate_password_hash(spec['password'])
+    room.creator_id = creator.id
+    db.session.add(room)
+    db.session.flush()
+    room.members.append(creator)
+    db.session.commit()
+
+    for topic_index, topic_data in enumerate(spec['syllabus']):
+        topic = Topic(name=topic_data['name'], room_id=room.id, order_index=topic_index)
+        db.session.add(topic)
+        db.session.flush()
+        for subtopic_index, subtopic_data in enumerate(topic_data['subtopics']):
+            db.session.add(Subtopic(name=subtopic_data['name'], estimated_time=subtopic_data['time'],
+                                    topic_id=topic.id, order_index=subtopic_index))
+    db.session.commit()
+
+    for username in spec['members']:
+        room = Room.query.filter_by(room_id=room.room_id).first()
+        check_password_hash(room.password_hash, spec['password'])
+        user = users_by_name[username]
+        if user not in room.members:
+            room.members.append(user)
+            db.session.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rooms', type=int, default=500)
+    parser.add_argument('--members', type=int, default=50)
+    parser.add_argument('--sample', type=int, default=10, help='Rooms timed on the per-room path.')
+    args = parser.parse_args()
+
+    with app.app_context():
+        password_hash = generate_password_hash('student')
+        db.session.execute(insert(User), [{
+            'username': f"student{index}",
+            'email': f"student{index}@example.com",
+            'password_hash': password_hash
+        } for index in range(COHORT_SIZE)])
+        db.session.commit()
+        creator = User.query.filter_by(username='student0').first()
+        usernames = [f"student{index}" for index in range(1, COHORT_SIZE)]
+
+        rooms = make_rooms(args.rooms, args.members, usernames)
+        start = time.perf_counter()
+        created, _ = provision_rooms(rooms, creator.id)
+        bulk_seconds = time.perf_counter() - start
+        print(f"bulk:     {len(created)} rooms x {args.members} members in {bulk_seconds:.2f}s")
+
+        users_by_name = {user.username: user for user in User.query.all()}
+        sample = make_rooms(args.sample, args.members, usernames)
+        start = time.perf_counter()
+        for spec in sample:
+            create_room_per_post(spec, creator, users_by_name)
+        per_room = (time.perf_counter() - start) / args.sample
+        print(f"per-room: {per_room:.2f}s per room, ~{per_room * args.rooms:.1f}s for {args.rooms} rooms "
+              f"({per_room * args.rooms / bulk_seconds:.0f}x slower)")
+
+
+if __name__ == '__main__':
+    main()
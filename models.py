@@ -75,6 +75,22 @@ class Room(db.Model):
             if not Room.query.filter_by(room_id=room_id).first():
                 return room_id
     
+    @staticmethod
+    def generate_room_ids(count, chunk_size=500):
+        # Draw candidates in bulk and check them with one IN query per chunk
+        # instead of one query per attempt, redrawing only the collisions
+        room_ids = set()
+        while len(room_ids) < count:
+            candidates = {''.join(random.choices(string.ascii_uppercase + string.digits, k=8))
+                          for _ in range(count - len(room_ids))} - room_ids
+            candidates = list(candidates)
+            for start in range(0, len(candidates), chunk_size):
+                chunk = candidates[start:start + chunk_size]
+                taken = {row.room_id for row in
+                         db.session.query(Room.room_id).filter(Room.room_id.in_(chunk))}
+                room_ids.update(room_id for room_id in chunk if room_id not in taken)
+        return list(room_ids)
+    
     def set_password(self, password):
         self.password_hash = generate_password_hash(password)
 
@@ -0,0 +1,260 @@
+import os
+import io
+import sys
+import csv
+import json
+from concurrent.futures import ThreadPoolExecutor
+import click
+from sqlalchemy import insert
+from werkzeug.security import generate_password_hash
+from app import app, db
+from models import User, Room, Topic, Subtopic, room_members
+
+# Rooms inserted per transaction; each batch commits its rooms, topics,
+# subtopics and memberships together
+BATCH_SIZE = 100
+# Keeps IN (...) lookups under SQLite's bound parameter limit
+LOOKUP_CHUNK = 500
+# Each scrypt hash holds ~32 MiB, so keep the pool small inside web workers
+HASH_WORKERS = min(4, os.cpu_count() or 1)
+# Same bounds as the syllabus editor's time input
+MIN_SUBTOPIC_TIME = 1
+MAX_SUBTOPIC_TIME = 300
+
+
+class ProvisioningError(Exception):
+    """A batch failed to insert; ``created`` lists the rooms already committed."""
+
+    def __init__(self, message, created):
+        super().__init__(message)
+        self.created = created
+
+
+def check_name(value, column, label):
+    if not isinstance(value, str) or not value.strip():
+        raise ValueError(f"{label} must be a non-empty string")
+    value = value.strip()
+    if len(value) > column.type.length:
+        raise ValueError(f"{label} is longer than {column.type.length} characters")
+    return value
+
+
+def parse_syllabus(syllabus):
+    if not isinstance(syllabus, list):
+        raise ValueError("syllabus must be a list of topics")
+
+    topics = []
+    for topic_index, topic_data in enumerate(syllabus, start=1):
+        if not isinstance(topic_data, dict):
+            raise ValueError(f"topic {topic_index} must be an object")
+        subtopics = topic_data.get('subtopics', [])
+        if not isinstance(subtopics, list):
+            raise ValueError(f"topic {topic_index} subtopics must be a list")
+
+        parsed_subtopics = []
+        for subtopic_index, subtopic_data in enumerate(subtopics, start=1):
+            label = f"topic {topic_index} subtopic {subtopic_index}"
+            if not isinstance(subtopic_data, dict):
+                raise ValueError(f"{label} must be an object")
+            time = subtopic_data.get('time')
+            if isinstance(time, bool) or not isinstance(time, int) \
+                    or not MIN_SUBTOPIC_TIME <= time <= MAX_SUBTOPIC_TIME:
+                raise ValueError(f"{label} time must be an integer from "
+                                 f"{MIN_SUBTOPIC_TIME} to {MAX_SUBTOPIC_TIME}")
+            parsed_subtopics.append({
+                'name': check_name(subtopic_data.get('name'), Subtopic.__table__.c.name, f"{label} name"),
+                'time': time
+            })
+
+        topics.append({
+            'name': check_name(topic_data.get('name'), Topic.__table__.c.name, f"topic {topic_index} name"),
+            'subtopics': parsed_subtopics
+        })
+    return topics
+
+
+def parse_rooms(text, filename='', max_rooms=None, max_members=None):
+    """Parse and validate a CSV or JSON room file into a list of room specs.
+
+    JSON is a list (or ``{"rooms": [...]}``) of objects with ``name``,
+    ``password``, ``members`` (usernames) and ``syllabus`` in the same shape
+    the syllabus editor posts. CSV has ``name`` and ``password`` columns, an
+    optional ``members`` column of ``;``-separated usernames and an optional
+    ``syllabus`` column holding that JSON. Every row is checked against the
+    column limits up front so nothing is written for an invalid file.
+    """
+    if filename.lower().endswith('.csv'):
+        entries = []
+        for index, row in enumerate(csv.DictReader(io.StringIO(text)), start=1):
+            try:
+                syllabus = json.loads(row['syllabus']) if row.get('syllabus') else []
+            except ValueError as e:
+                raise ValueError(f"Room {index}: syllabus is not valid JSON ({e})")
+            entries.append({
+                'name': row.get('name'),
+                'password': row.get('password'),
+                'members': (row.get('members') or '').split(';'),
+                'syllabus': syllabus
+            })
+    else:
+        entries = json.loads(text)
+        if isinstance(entries, dict):
+            entries = entries.get('rooms', [])
+        if not isinstance(entries, list):
+            raise ValueError("expected a list of rooms")
+
+    if max_rooms is not None and len(entries) > max_rooms:
+        raise ValueError(f"at most {max_rooms} rooms can be created per request")
+
+    rooms = []
+    for index, entry in enumerate(entries, start=1):
+        try:
+            if not isinstance(entry, dict):
+                raise ValueError("expected an object")
+            name = check_name(entry.get('name'), Room.__table__.c.name, "name")
+            password = entry.get('password')
+            if not isinstance(password, str) or not password:
+                raise ValueError("password must be a non-empty string")
+
+            members = entry.get('members') or []
+            if not isinstance(members, list) or not all(isinstance(username, str) for username in members):
+                raise ValueError("members must be a list of usernames")
+            members = [username.strip() for username in members if username.strip()]
+            if max_members is not None and len(members) > max_members:
+                raise ValueError(f"at most {max_members} members are allowed")
+
+            syllabus = parse_syllabus(entry.get('syllabus') or [])
+        except ValueError as e:
+            raise ValueError(f"Room {index}: {e}")
+
+        rooms.append({
+            'name': name,
+            'password': password,
+            'members': members,
+            'syllabus': syllabus
+        })
+    return rooms
+
+
+def lookup_user_ids(usernames):
+    usernames = list(usernames)
+    user_ids = {}
+    for start in range(0, len(usernames), LOOKUP_CHUNK):
+        chunk = usernames[start:start + LOOKUP_CHUNK]
+        for row in db.session.query(User.username, User.id).filter(User.username.in_(chunk)):
+            user_ids[row.username] = row.id
+    return user_ids
+
+
+def hash_passwords(passwords):
+    eventlet = sys.modules.get('eventlet')
+    if eventlet is not None and eventlet.patcher.is_monkey_patched('thread'):
+        # Under main.py's monkey patching ThreadPoolExecutor only hands out green
+        # threads, and scrypt never yields, so every hash would stall the hub.
+        # eventlet's tpool runs each hash on a real OS thread instead.
+        from eventlet import tpool
+        pool = eventlet.GreenPool(HASH_WORKERS)
+        return list(pool.imap(lambda password: tpool.execute(generate_password_hash, password), passwords))
+
+    # hashlib releases the GIL while hashing, so OS threads hash in parallel
+    with ThreadPoolExecutor(max_workers=HASH_WORKERS) as pool:
+        return list(pool.map(generate_password_hash, passwords))
+
+
+def provision_rooms(rooms, creator_id, batch_size=BATCH_SIZE):
+    """Create rooms with their syllabi and member rosters in bulk.
+
+    The creator is added to every room. Unknown member usernames are skipped
+    and returned. Rooms are committed in batches of ``batch_size``; if a batch
+    fails, ProvisioningError reports the rooms committed before it.
+    """
+    usernames = {username for spec in rooms for username in spec['members']}
+    user_ids = lookup_user_ids(usernames)
+    missing_members = sorted(usernames - user_ids.keys())
+
+    room_ids = Room.generate_room_ids(len(rooms))
+    password_hashes = hash_passwords(spec['password'] for spec in rooms)
+
+    created = []
+    for start in range(0, len(rooms), batch_size):
+        batch = range(start, min(start + batch_size, len(rooms)))
+        try:
+            room_rows = [{
+                'room_id': room_ids[i],
+                'name': rooms[i]['name'],
+                'password_hash': password_hashes[i],
+                'creator_id': creator_id
+            } for i in batch]
+            room_pks = dict(db.session.execute(
+                insert(Room).returning(Room.room_id, Room.id), room_rows
+            ).all())
+
+            topic_rows = []
+            topic_subtopics = []
+            member_rows = []
+            for i in batch:
+                room_pk = room_pks[room_ids[i]]
+                for topic_index, topic_data in enumerate(rooms[i]['syllabus']):
+                    topic_rows.append({'name': topic_data['name'], 'room_id': room_pk, 'order_index': topic_index})
+                    topic_subtopics.append(topic_data['subtopics'])
+
+                member_ids = {creator_id}
+                member_ids.update(user_ids[username] for username in rooms[i]['members'] if username in user_ids)
+                member_rows.extend({'room_id': room_pk, 'user_id': user_id} for user_id in member_ids)
+
+            if topic_rows:
+                topic_pks = db.session.scalars(
+                    insert(Topic).returning(Topic.id, sort_by_parameter_order=True), topic_rows
+                ).all()
+                subtopic_rows = [{
+                    'name': subtopic_data['name'],
+                    'estimated_time': subtopic_data['time'],
+                    'topic_id': topic_pk,
+                    'order_index': subtopic_index
+                } for topic_pk, subtopics in zip(topic_pks, topic_subtopics)
+                  for subtopic_index, subtopic_data in enumerate(subtopics)]
+                if subtopic_rows:
+                    db.session.execute(insert(Subtopic), subtopic_rows)
+
+            db.session.execute(insert(room_members), member_rows)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            raise ProvisioningError(
+                f"Provisioning stopped at room {start + 1} after {len(created)} rooms were created: {e}",
+                created
+            ) from e
+
+        created.extend({'name': rooms[i]['name'], 'room_id': room_ids[i]} for i in batch)
+
+    return created, missing_members
+
+
+@app.cli.command('provision-rooms')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--creator', required=True, help='Username that owns the created rooms.')
+@click.option('--batch-size', default=BATCH_SIZE, show_default=True, help='Rooms per transaction.')
+def provision_rooms_command(path, creator, batch_size):
+    """Create rooms, syllabi and member rosters from a CSV or JSON file."""
+    user = User.query.filter_by(username=creator).first()
+    if not user:
+        raise click.ClickException(f"Unknown creator: {creator}")
+
+    # utf-8-sig drops the byte order mark Excel puts at the start of CSV exports
+    with open(path, encoding='utf-8-sig') as f:
+        try:
+            rooms = parse_rooms(f.read(), path)
+        except (ValueError, KeyError, TypeError) as e:
+            raise click.ClickException(f"Invalid room file: {e}")
+
+    try:
+        created, missing_members = provision_rooms(rooms, user.id, batch_size=batch_size)
+    except ProvisioningError as e:
+        for room in e.created:
+            click.echo(f"{room['room_id']}\t{room['name']}")
+        raise click.ClickException(str(e))
+
+    for room in created:
+        click.echo(f"{room['room_id']}\t{room['name']}")
+    if missing_members:
+        click.echo(f"Skipped unknown members: {', '.join(missing_members)}", err=True)
@@ -3,6 +3,7 @@ from flask_login import login_user, logout_user, login_required, current_user
 from werkzeug.security import generate_password_hash, check_password_hash
 from app import app, db
 from models import User, Room, Topic, Subtopic, UserProgress, StudySession, Note
+from provisioning import parse_rooms, provision_rooms, ProvisioningError
 from datetime import datetime
 import json
 
@@ -123,6 +124,40 @@ def join_room():
     
     return render_template('join_room.html')
 
+@app.route('/api/rooms/bulk', methods=['POST'])
+@login_required
+def bulk_create_rooms():
+    # Enrols existing users without their room password, so only allow-listed accounts may use it
+    if current_user.username not in app.config['BULK_PROVISIONING_USERS']:
+        return jsonify({'error': 'Not authorized'}), 403
+    
+    # Accepts an uploaded CSV/JSON file or a JSON body in the same format
+    limits = {
+        'max_rooms': app.config['BULK_MAX_ROOMS'],
+        'max_members': app.config['BULK_MAX_MEMBERS']
+    }
+    try:
+        upload = request.files.get('file')
+        if upload:
+            # utf-8-sig drops the byte order mark Excel puts at the start of CSV exports
+            rooms = parse_rooms(upload.read().decode('utf-8-sig'), upload.filename or '', **limits)
+        else:
+            rooms = parse_rooms(request.get_data(as_text=True), **limits)
+    except (ValueError, KeyError, TypeError) as e:
+        return jsonify({'error': f'Invalid room data: {e}'}), 400
+    
+    try:
+        created, missing_members = provision_rooms(rooms, current_user.id)
+    except ProvisioningError as e:
+        app.logger.error(f"Bulk provisioning error: {e}")
+        return jsonify({'error': 'Provisioning failed partway', 'rooms': e.created}), 500
+    
+    return jsonify({
+        'success': True,
+        'rooms': created,
+        'missing_members': missing_members
+    })
+
 @app.route('/room/<room_id>')
 @login_required
 def room(room_id):
@@ -169,15 +204,25 @@ def room(room_id):
         }
     
     is_creator = current_user.id == room.creator_id
-    
-    return render_template('room.html', 
+
+    # Existing syllabus for the creator's editor, handed to static/js/room.js as JSON
+    syllabus = []
+    if is_creator:
+        syllabus = [{
+            'name': topic.name,
+            'subtopics': [{'name': subtopic.name, 'time': subtopic.estimated_time}
+                          for subtopic in topic.subtopics]
+        } for topic in topics]
+
+    return render_template('room.html',
                          room=room, 
                          topics=topics, 
                          members=members, 
                          notes=notes,
                          user_progress=user_progress,
                          topic_times=topic_times,
-                         is_creator=is_creator)
+                         is_creator=is_creator,
+                         syllabus=syllabus)
 
 @app.route('/update_daily_goal', methods=['POST'])
 @login_required